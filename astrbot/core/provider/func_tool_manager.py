@@ -312,6 +312,8 @@ class FuncCall:
         {"type": "terminate"} 终止所有MCP客户端
 
         {"type": "terminate", "name": "mcp_server_name"} 终止指定的MCP客户端
+
+        {"type": "restart", "name": "mcp_server_name", "cfg": {...}} 重启指定的MCP客户端（终止后立即初始化）
         """
         while True:
             data = await self.mcp_service_queue.get()
@@ -347,6 +349,22 @@ class FuncCall:
                             self.mcp_client_event[name].set()
                             self.mcp_client_event.pop(name, None)
                     self.func_list = [f for f in self.func_list if f.origin != "mcp"]
+            elif data["type"] == "restart":
+                # 单条消息内完成终止 + 重新初始化，避免两条消息之间客户端不可用
+                name = data["name"]
+                if name in self.mcp_client_event:
+                    self.mcp_client_event[name].set()
+                    self.mcp_client_event.pop(name, None)
+                    self.func_list = [
+                        f
+                        for f in self.func_list
+                        if not (f.origin == "mcp" and f.mcp_server_name == name)
+                    ]
+                event = asyncio.Event()
+                asyncio.create_task(
+                    self._init_mcp_client_task_wrapper(name, data["cfg"], event)
+                )
+                self.mcp_client_event[name] = event
 
     async def _init_mcp_client_task_wrapper(
         self, name: str, cfg: dict, event: asyncio.Event
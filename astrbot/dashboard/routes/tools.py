@@ -1,10 +1,20 @@
+import asyncio
+import copy
 import json
 import os
+import time
 import traceback
+import uuid
+from itertools import islice
 
 import aiohttp
 from quart import request
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from astrbot.core import logger
 from astrbot.core.core_lifecycle import AstrBotCoreLifecycle
 from astrbot.core.utils.astrbot_path import get_astrbot_data_path
@@ -13,8 +23,20 @@ from .route import Response, Route, RouteContext
 
 DEFAULT_MCP_CONFIG = {"mcpServers": {}}
 
+MCP_MARKET_API = "https://api.soulter.top/astrbot/mcpservers?page={}&page_size={}"
+
+# 请求体中不属于服务器配置本身的特殊字段
+EXCLUDED_SERVER_FIELDS = frozenset({"name", "active", "tools", "errlogs", "mcpServers"})
+
 
 class ToolsRoute(Route):
+    # 全量拉取市场列表时使用的单页大小
+    _fetch_page_size = 2000
+    # 全量拉取时的最大并发分页请求数，避免打爆上游
+    _fetch_concurrency = 8
+    # 磁盘缓存的可用时长（秒），超过则重启后仍需全量拉取
+    _disk_cache_ttl = 3600.0
+
     def __init__(
         self, context: RouteContext, core_lifecycle: AstrBotCoreLifecycle
     ) -> None:
@@ -29,11 +51,56 @@ class ToolsRoute(Route):
         }
         self.register_routes()
         self.tool_mgr = self.core_lifecycle.provider_manager.llm_tools
+        # 复用 HTTP 会话以避免每次请求都重新建立 TCP/TLS 连接
+        self._http_session: aiohttp.ClientSession | None = None
+        # 配置文件路径固定，启动时算好即可
+        self.mcp_config_path = os.path.join(get_astrbot_data_path(), "mcp_server.json")
+        # 按文件 mtime 缓存 MCP 配置，避免每次请求都重新读盘解析
+        self._cfg_cache: dict | None = None
+        self._cfg_mtime: float = 0.0
+        # 配置写入互斥锁：save 变为异步后，load→修改→save 之间会让出事件循环，
+        # 必须整段持锁才能避免并发请求互相覆盖（丢更新）
+        self._cfg_lock = asyncio.Lock()
+        # MCP 市场全量列表缓存（用于服务端搜索），带 TTL
+        self._mcp_cache: list[dict] | None = None
+        # 检索索引采用平行数组（SoA）：三列小写字符串 + 原始条目引用
+        self._names_lc: list[str] = []
+        self._names_h_lc: list[str] = []
+        self._desc_lc: list[str] = []
+        self._servers_ref: list[dict] = []
+        self._cache_timestamp: float = 0.0
+        self._cache_ttl: float = 300.0
+        # 按页码记录内部全量刷新（固定 _fetch_page_size）的 ETag 及对应数据，
+        # 命中 304 时免去传输和解析；用户可控的分页组合不入缓存，避免无界增长
+        self._page_etag: dict[tuple[int, int], tuple[str, dict]] = {}
+        # 缓存刷新互斥锁与后台刷新任务（stale-while-revalidate）
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task | None = None
+        # 同一时刻并发触发的刷新共享一个 in-flight Task，只真正拉取一次
+        self._refresh_inflight: asyncio.Task | None = None
+        # 市场缓存落盘，进程重启后免于冷启动全量拉取
+        self._market_cache_path = os.path.join(
+            get_astrbot_data_path(), "mcp_market_cache.json"
+        )
+        self._disk_cache_loaded = False
+        self.app.after_serving(self._close_http_session)
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """懒加载并复用 aiohttp 会话（连接池）"""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=32,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75,
+                )
+            )
+        return self._http_session
 
-    @property
-    def mcp_config_path(self):
-        data_dir = get_astrbot_data_path()
-        return os.path.join(data_dir, "mcp_server.json")
+    async def _close_http_session(self):
+        """随 WebUI 关闭一并释放 HTTP 会话"""
+        if self._http_session is not None and not self._http_session.closed:
+            await self._http_session.close()
 
     def load_mcp_config(self):
         if not os.path.exists(self.mcp_config_path):
@@ -44,16 +111,43 @@ class ToolsRoute(Route):
             return DEFAULT_MCP_CONFIG
 
         try:
-            with open(self.mcp_config_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            mtime = os.path.getmtime(self.mcp_config_path)
+            # 文件未变化时直接复用缓存，省去读盘和 JSON 解析
+            if self._cfg_cache is None or mtime != self._cfg_mtime:
+                with open(self.mcp_config_path, "rb") as f:
+                    raw = f.read()
+                # 优先使用 C 实现的 orjson，未安装时退回标准库
+                self._cfg_cache = (
+                    orjson.loads(raw) if orjson is not None else json.loads(raw)
+                )
+                self._cfg_mtime = mtime
+            # 深拷贝一份，防止调用方的修改污染缓存
+            return copy.deepcopy(self._cfg_cache)
         except Exception as e:
             logger.error(f"加载 MCP 配置失败: {e}")
             return DEFAULT_MCP_CONFIG
 
-    def save_mcp_config(self, config):
+    async def save_mcp_config(self, config):
         try:
-            with open(self.mcp_config_path, "w", encoding="utf-8") as f:
-                json.dump(config, f, ensure_ascii=False, indent=4)
+            if orjson is not None:
+                raw = orjson.dumps(
+                    config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
+            else:
+                raw = json.dumps(config, ensure_ascii=False, indent=4).encode("utf-8")
+
+            # 先写临时文件再原子替换，避免写入中断导致配置被截断；
+            # 临时文件名唯一，防止并发写入互相踩踏；写盘放到线程池执行，不阻塞事件循环
+            tmp_path = f"{self.mcp_config_path}.{uuid.uuid4().hex}.tmp"
+
+            def _write():
+                with open(tmp_path, "wb") as f:
+                    f.write(raw)
+                os.replace(tmp_path, self.mcp_config_path)
+
+            await asyncio.to_thread(_write)
+            self._cfg_cache = copy.deepcopy(config)
+            self._cfg_mtime = os.path.getmtime(self.mcp_config_path)
             return True
         except Exception as e:
             logger.error(f"保存 MCP 配置失败: {e}")
@@ -77,14 +171,10 @@ class ToolsRoute(Route):
                         server_info[key] = value
 
                 # 如果MCP客户端已初始化，从客户端获取工具名称
-                for (
-                    name_key,
-                    mcp_client,
-                ) in self.tool_mgr.mcp_client_dict.items():
-                    if name_key == name:
-                        server_info["tools"] = [tool.name for tool in mcp_client.tools]
-                        server_info["errlogs"] = mcp_client.server_errlogs
-                        break
+                mcp_client = self.tool_mgr.mcp_client_dict.get(name)
+                if mcp_client is not None:
+                    server_info["tools"] = [tool.name for tool in mcp_client.tools]
+                    server_info["errlogs"] = mcp_client.server_errlogs
                 else:
                     server_info["tools"] = []
 
@@ -106,32 +196,32 @@ class ToolsRoute(Route):
                 return Response().error("服务器名称不能为空").__dict__
 
             # 移除特殊字段并检查配置是否有效
-            has_valid_config = False
-            server_config = {"active": server_data.get("active", True)}
-
-            # 复制所有配置字段
-            for key, value in server_data.items():
-                if key not in ["name", "active", "tools", "errlogs"]:  # 排除特殊字段
-                    if key == "mcpServers":
-                        key_0 = list(server_data["mcpServers"].keys())[
-                            0
-                        ]  # 不考虑为空的情况
-                        server_config = server_data["mcpServers"][key_0]
-                    else:
-                        server_config[key] = value
-                    has_valid_config = True
+            if "mcpServers" in server_data:
+                # 标准 mcpServers 格式，取第一个条目（不考虑为空的情况）
+                server_config = next(iter(server_data["mcpServers"].values()))
+            else:
+                server_config = {
+                    k: v
+                    for k, v in server_data.items()
+                    if k not in EXCLUDED_SERVER_FIELDS
+                }
 
-            if not has_valid_config:
+            if not server_config:
                 return Response().error("必须提供有效的服务器配置").__dict__
 
-            config = self.load_mcp_config()
+            server_config["active"] = server_data.get("active", True)
+
+            # 持锁覆盖整个 load→修改→save，恢复单写者语义
+            async with self._cfg_lock:
+                config = self.load_mcp_config()
 
-            if name in config["mcpServers"]:
-                return Response().error(f"服务器 {name} 已存在").__dict__
+                if name in config["mcpServers"]:
+                    return Response().error(f"服务器 {name} 已存在").__dict__
 
-            config["mcpServers"][name] = server_config
+                config["mcpServers"][name] = server_config
+                saved = await self.save_mcp_config(config)
 
-            if self.save_mcp_config(config):
+            if saved:
                 # 动态初始化新MCP客户端
                 await self.tool_mgr.mcp_service_queue.put({
                     "type": "init",
@@ -154,53 +244,55 @@ class ToolsRoute(Route):
             if not name:
                 return Response().error("服务器名称不能为空").__dict__
 
-            config = self.load_mcp_config()
+            # 持锁覆盖整个 load→修改→save，恢复单写者语义
+            async with self._cfg_lock:
+                config = self.load_mcp_config()
 
-            if name not in config["mcpServers"]:
-                return Response().error(f"服务器 {name} 不存在").__dict__
+                if name not in config["mcpServers"]:
+                    return Response().error(f"服务器 {name} 不存在").__dict__
 
-            # 获取活动状态
-            active = server_data.get(
-                "active", config["mcpServers"][name].get("active", True)
-            )
+                # 获取活动状态
+                active = server_data.get(
+                    "active", config["mcpServers"][name].get("active", True)
+                )
 
-            # 创建新的配置对象
-            server_config = {"active": active}
-
-            # 仅更新活动状态的特殊处理
-            only_update_active = True
-
-            # 复制所有配置字段
-            for key, value in server_data.items():
-                if key not in ["name", "active", "tools", "errlogs"]:  # 排除特殊字段
-                    if key == "mcpServers":
-                        key_0 = list(server_data["mcpServers"].keys())[
-                            0
-                        ]  # 不考虑为空的情况
-                        server_config = server_data["mcpServers"][key_0]
-                    else:
-                        server_config[key] = value
+                # 创建新的配置对象（剔除特殊字段）
+                if "mcpServers" in server_data:
+                    # 标准 mcpServers 格式，取第一个条目（不考虑为空的情况）
+                    server_config = next(iter(server_data["mcpServers"].values()))
                     only_update_active = False
-
-            # 如果只更新活动状态，保留原始配置
-            if only_update_active:
-                for key, value in config["mcpServers"][name].items():
-                    if key != "active":  # 除了active之外的所有字段都保留
-                        server_config[key] = value
-
-            config["mcpServers"][name] = server_config
-
-            if self.save_mcp_config(config):
+                else:
+                    server_config = {
+                        k: v
+                        for k, v in server_data.items()
+                        if k not in EXCLUDED_SERVER_FIELDS
+                    }
+                    # 请求体中没有任何配置字段时，视为仅更新活动状态
+                    only_update_active = not server_config
+
+                server_config["active"] = active
+
+                # 如果只更新活动状态，保留原始配置
+                if only_update_active:
+                    for key, value in config["mcpServers"][name].items():
+                        if key != "active":  # 除了active之外的所有字段都保留
+                            server_config[key] = value
+
+                # 配置完全没有变化时直接返回，省去整个文件重写和无意义的重启
+                if server_config == config["mcpServers"][name]:
+                    return Response().ok(None, "配置无变化").__dict__
+
+                config["mcpServers"][name] = server_config
+                saved = await self.save_mcp_config(config)
+
+            if saved:
                 # 处理MCP客户端状态变化
                 if active:
                     # 如果要激活服务器或者配置已更改
                     if name in self.tool_mgr.mcp_client_dict or not only_update_active:
+                        # 单条 restart 消息由消费端原子地完成终止 + 初始化
                         await self.tool_mgr.mcp_service_queue.put({
-                            "type": "terminate",
-                            "name": name,
-                        })
-                        await self.tool_mgr.mcp_service_queue.put({
-                            "type": "init",
+                            "type": "restart",
                             "name": name,
                             "cfg": config["mcpServers"][name],
                         })
@@ -234,15 +326,19 @@ class ToolsRoute(Route):
             if not name:
                 return Response().error("服务器名称不能为空").__dict__
 
-            config = self.load_mcp_config()
+            # 持锁覆盖整个 load→修改→save，恢复单写者语义
+            async with self._cfg_lock:
+                config = self.load_mcp_config()
 
-            if name not in config["mcpServers"]:
-                return Response().error(f"服务器 {name} 不存在").__dict__
+                if name not in config["mcpServers"]:
+                    return Response().error(f"服务器 {name} 不存在").__dict__
 
-            # 删除服务器配置
-            del config["mcpServers"][name]
+                # 删除服务器配置
+                del config["mcpServers"][name]
 
-            if self.save_mcp_config(config):
+                saved = await self.save_mcp_config(config)
+
+            if saved:
                 # 关闭并删除MCP客户端
                 if name in self.tool_mgr.mcp_client_dict:
                     self.tool_mgr.mcp_service_queue.put_nowait({
@@ -257,27 +353,284 @@ class ToolsRoute(Route):
             logger.error(traceback.format_exc())
             return Response().error(f"删除 MCP 服务器失败: {str(e)}").__dict__
 
+    def _is_cache_valid(self) -> bool:
+        """市场缓存是否存在且未过期"""
+        return (
+            self._mcp_cache is not None
+            and time.time() - self._cache_timestamp < self._cache_ttl
+        )
+
+    def _clear_cache(self):
+        """清空市场列表缓存及搜索索引"""
+        self._mcp_cache = None
+        self._names_lc = []
+        self._names_h_lc = []
+        self._desc_lc = []
+        self._servers_ref = []
+        self._cache_timestamp = 0.0
+
+    async def _fetch_mcp_page(
+        self,
+        session: aiohttp.ClientSession,
+        page: int,
+        page_size: int,
+        retries: int = 3,
+    ) -> dict:
+        """拉取市场单页数据，返回接口的 data 字段
+
+        带 ETag 协商缓存：上游返回 304 时直接复用上次解析好的数据。
+        网络错误与 5xx 做最多 retries 次指数退避重试，避免瞬时抖动污染缓存；
+        非 200 响应统一抛出带状态码的 ClientResponseError，4xx 不重试。
+        """
+        url = MCP_MARKET_API.format(page, page_size)
+        # 只为内部全量刷新的固定页大小保留协商缓存；
+        # 透传分页的 (page, page_size) 由用户控制，缓存它会无界占用内存
+        cacheable = page_size == self._fetch_page_size
+        cached = self._page_etag.get((page, page_size)) if cacheable else None
+        headers = {"If-None-Match": cached[0]} if cached is not None else {}
+        for attempt in range(retries):
+            try:
+                async with session.get(url, headers=headers) as response:
+                    if response.status == 304 and cached is not None:
+                        return cached[1]
+                    if response.status != 200:
+                        raise aiohttp.ClientResponseError(
+                            response.request_info,
+                            response.history,
+                            status=response.status,
+                            message=f"HTTP {response.status}",
+                        )
+                    raw = await response.read()
+                    # 大页（_fetch_page_size 条）解析走 orjson，未安装退回标准库
+                    payload = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                    data = payload["data"]
+                    etag = response.headers.get("ETag")
+                    if etag and cacheable:
+                        self._page_etag[(page, page_size)] = (etag, data)
+                    return data
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if isinstance(e, aiohttp.ClientResponseError) and e.status < 500:
+                    # 4xx 不是瞬时故障，重试没有意义
+                    raise
+                if attempt == retries - 1:
+                    raise
+                await asyncio.sleep(0.2 * 2**attempt)
+
+    async def _refresh_cache(self, session: aiohttp.ClientSession) -> list[dict]:
+        """全量拉取市场列表并重建缓存与搜索索引
+
+        并发调用只会触发一次真正的拉取：刷新在独立 Task 中进行，
+        所有调用方通过 asyncio.shield 等待同一个 Task 的结果，
+        单个请求被取消（如客户端断开）不会波及刷新本身和其他等待方。
+        """
+        # 锁只保护 in-flight Task 的检查与创建，实际拉取在锁外进行
+        async with self._refresh_lock:
+            task = self._refresh_inflight
+            if task is None:
+                if self._is_cache_valid():
+                    # 已有协程刚刚完成了刷新
+                    return self._mcp_cache
+                task = asyncio.create_task(self._do_refresh_cache(session))
+                task.add_done_callback(self._on_refresh_done)
+                self._refresh_inflight = task
+        return await asyncio.shield(task)
+
+    def _on_refresh_done(self, task: asyncio.Task):
+        """刷新 Task 结束后清理 in-flight 标记"""
+        self._refresh_inflight = None
+        if not task.cancelled():
+            # 等待方可能全部被取消，主动取回异常避免 "exception never retrieved" 告警
+            task.exception()
+
+    async def _do_refresh_cache(self, session: aiohttp.ClientSession) -> list[dict]:
+        """实际执行全量拉取并更新缓存，仅由 _refresh_cache 调用"""
+        first = await self._fetch_mcp_page(session, 1, self._fetch_page_size)
+        servers = list(first.get("mcpservers", []))
+        total_pages = first.get("pagination", {}).get("totalPages", 1)
+        if total_pages > 1:
+            sem = asyncio.Semaphore(self._fetch_concurrency)
+
+            async def _bounded(p: int) -> dict:
+                async with sem:
+                    return await self._fetch_mcp_page(session, p, self._fetch_page_size)
+
+            tasks = [_bounded(p) for p in range(2, total_pages + 1)]
+            complete = True
+            for data in await asyncio.gather(*tasks, return_exceptions=True):
+                if isinstance(data, BaseException):
+                    logger.error(f"拉取 MCP 市场分页失败: {data}")
+                    complete = False
+                    continue
+                servers.extend(data.get("mcpservers", []))
+
+            if not complete:
+                # 结果不完整时不更新缓存，避免后续 5 分钟都在用残缺快照
+                if self._mcp_cache is not None:
+                    logger.warning("MCP 市场列表拉取不完整，继续使用现有缓存")
+                    return self._mcp_cache
+                logger.warning("MCP 市场列表拉取不完整，本次结果不写入缓存")
+                return servers
+
+        self._mcp_cache = servers
+        self._build_search_index(servers)
+        self._cache_timestamp = time.time()
+        await asyncio.to_thread(
+            self._write_market_cache, servers, self._cache_timestamp
+        )
+        return servers
+
+    def _build_search_index(self, servers: list[dict]):
+        """把检索字段预转小写并拆成平行数组，搜索时只需扫这三列字符串"""
+        self._names_lc = [(s.get("name") or "").lower() for s in servers]
+        self._names_h_lc = [(s.get("name_h") or "").lower() for s in servers]
+        self._desc_lc = [(s.get("description") or "").lower() for s in servers]
+        self._servers_ref = servers
+
+    def _write_market_cache(self, servers: list[dict], ts: float):
+        """将市场列表缓存落盘，失败只记录日志"""
+        try:
+            payload = {"ts": ts, "servers": servers}
+            if orjson is not None:
+                raw = orjson.dumps(payload)
+            else:
+                raw = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            tmp_path = self._market_cache_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(raw)
+            os.replace(tmp_path, self._market_cache_path)
+        except Exception as e:
+            logger.warning(f"写入 MCP 市场磁盘缓存失败: {e}")
+
+    def _load_market_cache_from_disk(self):
+        """进程重启后尝试从磁盘恢复市场缓存，避免冷启动全量拉取"""
+        try:
+            if not os.path.exists(self._market_cache_path):
+                return
+            with open(self._market_cache_path, "rb") as f:
+                raw = f.read()
+            payload = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            ts = payload.get("ts", 0)
+            servers = payload.get("servers")
+            if not servers or time.time() - ts >= self._disk_cache_ttl:
+                return
+            self._mcp_cache = servers
+            self._cache_timestamp = ts
+            self._build_search_index(servers)
+        except Exception as e:
+            logger.warning(f"读取 MCP 市场磁盘缓存失败: {e}")
+
+    async def _refresh_cache_background(self, session: aiohttp.ClientSession):
+        """后台刷新缓存，异常只记录日志，不影响已返回的旧数据"""
+        try:
+            await self._refresh_cache(session)
+        except Exception:
+            logger.error(f"后台刷新 MCP 市场缓存失败: {traceback.format_exc()}")
+
+    async def _fetch_all_mcp_servers(
+        self, session: aiohttp.ClientSession
+    ) -> tuple[list[dict], bool]:
+        """获取市场全量服务器列表（带 TTL 缓存），供服务端搜索使用
+
+        缓存软过期（TTL ~ 2×TTL）时先返回旧数据并调度后台刷新，
+        只有缓存为空或硬过期才阻塞等待全量拉取。
+
+        返回 (服务器列表, 是否来自缓存)，调用方可据此记录缓存命中情况，
+        无需再调用一次 _is_cache_valid()。
+        """
+        if not self._disk_cache_loaded:
+            self._disk_cache_loaded = True
+            if self._mcp_cache is None:
+                self._load_market_cache_from_disk()
+
+        if self._is_cache_valid():
+            return self._mcp_cache, True
+
+        if (
+            self._mcp_cache is not None
+            and time.time() - self._cache_timestamp < self._cache_ttl * 2
+        ):
+            if self._refresh_task is None or self._refresh_task.done():
+                self._refresh_task = asyncio.create_task(
+                    self._refresh_cache_background(session)
+                )
+            return self._mcp_cache, True
+
+        return await self._refresh_cache(session), False
+
+    def _filter_servers(self, servers: list[dict], term: str) -> list[dict]:
+        """对 servers 做子串匹配，term 需已转为小写
+
+        servers 为已建索引的缓存列表时走预构建的平行数组；
+        否则（如不完整快照未入缓存）退回逐条 lower() 匹配。
+        """
+        if servers is self._servers_ref:
+            names = self._names_lc
+            names_h = self._names_h_lc
+            descs = self._desc_lc
+            refs = self._servers_ref
+            return [
+                refs[i]
+                for i in range(len(refs))
+                if term in names[i] or term in names_h[i] or term in descs[i]
+            ]
+        return [
+            s
+            for s in servers
+            if term in (s.get("name") or "").lower()
+            or term in (s.get("name_h") or "").lower()
+            or term in (s.get("description") or "").lower()
+        ]
+
+    def _paginate_list(
+        self, items: list[dict], page: int, page_size: int
+    ) -> tuple[list[dict], dict]:
+        """对过滤结果做本地分页，返回 (当前页条目, 分页信息)"""
+        total = len(items)
+        total_pages = (total + page_size - 1) // page_size if page_size > 0 else 1
+        start_idx = (page - 1) * page_size
+        end_idx = start_idx + page_size
+        pagination = {
+            "total": total,
+            "totalPages": max(total_pages, 1),
+            "currentPage": page,
+        }
+        # islice 避免常规切片的整段拷贝开销
+        return list(islice(items, start_idx, end_idx)), pagination
+
     async def get_mcp_markets(self):
         page = request.args.get("page", 1, type=int)
         page_size = request.args.get("page_size", 10, type=int)
-        BASE_URL = (
-            "https://api.soulter.top/astrbot/mcpservers?page={}&page_size={}".format(
-                page,
-                page_size,
-            )
-        )
+        search = request.args.get("search", "", type=str).strip()
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{BASE_URL}") as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return Response().ok(data["data"]).__dict__
-                    else:
-                        return (
-                            Response()
-                            .error(f"获取市场数据失败: HTTP {response.status}")
-                            .__dict__
-                        )
+            session = await self._get_session()
+
+            if not search:
+                # 无搜索词时直接透传上游的分页结果；
+                # 面向用户的路径不做重试，非 200 按原样带状态码返回
+                try:
+                    data = await self._fetch_mcp_page(
+                        session, page, page_size, retries=1
+                    )
+                except aiohttp.ClientResponseError as e:
+                    return (
+                        Response()
+                        .error(f"获取市场数据失败: HTTP {e.status}")
+                        .__dict__
+                    )
+                return Response().ok(data).__dict__
+
+            # 搜索在全量缓存上进行，避免上游不支持检索
+            term = search.lower()
+            servers, from_cache = await self._fetch_all_mcp_servers(session)
+            filtered = self._filter_servers(servers, term)
+            paged, pagination = self._paginate_list(filtered, page, page_size)
+            logger.debug(
+                f"MCP 市场搜索 '{search}'：{'命中缓存' if from_cache else '未命中缓存'}，"
+                f"匹配 {len(filtered)} 条"
+            )
+            return (
+                Response().ok({"mcpservers": paged, "pagination": pagination}).__dict__
+            )
         except Exception as _:
             logger.error(traceback.format_exc())
         return Response().error("获取市场数据失败").__dict__